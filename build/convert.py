@@ -10,10 +10,15 @@ ITX accent convention (postfix): the marker \\`, \\', \\" appears
 immediately AFTER the vowel (or vowel-containing syllable) it marks.
 """
 
-import bisect
+import hashlib
+import importlib.metadata
 import json
+import os
+import pickle
 import re
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from indic_transliteration import sanscript
@@ -30,95 +35,128 @@ RV_FILE = SOURCE_DIR / "r10.itx"
 TA_FILE = SOURCE_DIR / "taittirIyaAraNyaka.itx"
 TS_FILE = Path("/Users/meru/kainkaryam/taitsamhita1.itx")
 OUTPUT_DIR = DATA_DIR / "processed"
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+
+# Texts with at least this many verses are built across worker processes;
+# below it, pool start-up costs more than it saves.
+PARALLEL_MIN_VERSES = 200
 
 # ---------------------------------------------------------------------------
 # ITRANS vowel regex (longer sequences first)
 # ---------------------------------------------------------------------------
-ITRANS_VOWEL_RE = re.compile(
-    r"R\^I|R\^i|L\^I|L\^i|ai|au|AA|II|UU|ee|oo|A|I|U|a|i|u|e|o"
+ITRANS_VOWELS = (
+    "R^I", "R^i", "L^I", "L^i", "ai", "au", "AA", "II", "UU", "ee", "oo",
+    "A", "I", "U", "a", "i", "u", "e", "o",
 )
+ITRANS_VOWEL_RE = re.compile('|'.join(map(re.escape, ITRANS_VOWELS)))
+
+# Svara marker, and the same vowels matched in raw text where a marker may
+# sit between the characters of a digraph (e.g. R\`^i, a\`i).
+SVARA_MARKER_RE = re.compile(r"\\([`'\"])")
+ITRANS_MARKED_VOWEL_RE = re.compile('|'.join(
+    r"(?:\\[`'\"])?".join(map(re.escape, v)) for v in ITRANS_VOWELS
+))
 
 # IAST vowel regex
 IAST_VOWEL_RE = re.compile(
     r"ai|au|ā|ī|ū|ṛ|ṝ|ḷ|ḹ|a|i|u|e|o", re.IGNORECASE
 )
 
-# Devanagari code-point sets
-DEVA_CONSONANTS = set(range(0x0915, 0x093A)) | set(range(0x0958, 0x0960))
+# Devanagari character sets (single-character strings, tested directly)
+DEVA_CONSONANTS = frozenset(map(chr, [*range(0x0915, 0x093A), *range(0x0958, 0x0960)]))
 DEVA_VIRAMA = '\u094D'
-DEVA_MATRAS = set(range(0x093E, 0x094D)) | {0x0962, 0x0963}
-DEVA_INDEP_VOWELS = set(range(0x0904, 0x0915))
+DEVA_MATRAS = frozenset(map(chr, [*range(0x093E, 0x094D), 0x0962, 0x0963]))
+DEVA_INDEP_VOWELS = frozenset(map(chr, range(0x0904, 0x0915)))
 
 # Combining svara marks
 SVARA_ANUDATTA     = '\u0952'   # ॒  horizontal bar below
 SVARA_SVARITA      = '\u0951'   # ॑  single vertical stroke above
 SVARA_IND_SVARITA  = '\u1CDA'   # ᳚  double vertical stroke above (independent svarita)
 
+# ITX marker character → svara type, and svara type → combining mark
+_MARKER_TYPE = {'`': 'anudatta', "'": 'svarita', '"': 'ind_svarita'}
+_SVARA_MARK = {
+    'anudatta': SVARA_ANUDATTA,
+    'ind_svarita': SVARA_IND_SVARITA,
+    'svarita': SVARA_SVARITA,
+}
+
 
 # ===================================================================
 # 1. Svara extraction (postfix convention, verse-level)
 # ===================================================================
 
-def strip_svaras(itrans: str):
-    """Remove \\`, \\', \\" markers. Return (clean_text, svara_list).
+def scan_verse(itrans: str):
+    """Strip svara markers and split into tokens in a single pass.
 
-    Markers are postfix: they follow the vowel they modify.
-    svara_list: [(vowel_index, type), ...] 0-based in clean text.
+    Returns (clean_text, svara_list, token_list) where svara_list is as for
+    strip_svaras and token_list is [(token_str, vowel_count, pada_idx), ...]
+    with | and || separators skipped.
     """
     clean_chars: list[str] = []
-    markers: list[tuple[int, str]] = []   # (clean_offset_of_marker, type)
+    svaras: list[tuple[int, str]] = []
+    spans: list[tuple[int, int, int]] = []   # (clean_start, clean_end, vowels)
+    # Single pass: copy text, count vowels as they are matched, attach
+    # each marker to the most recent vowel seen, and close a token at
+    # every whitespace run.
+    vowel_count = 0
+    tok_start = 0
+    tok_vowels = 0
+    n = len(itrans)
     i = 0
-    while i < len(itrans):
-        if (i + 1 < len(itrans) and itrans[i] == '\\'
-                and itrans[i + 1] in "`'\""):
-            ch = itrans[i + 1]
-            typ = {'`': 'anudatta', "'": 'svarita', '"': 'ind_svarita'}[ch]
-            markers.append((len(clean_chars), typ))
+    while i < n:
+        ch = itrans[i]
+        if ch == '\\' and i + 1 < n and itrans[i + 1] in "`'\"":
+            typ = _MARKER_TYPE[itrans[i + 1]]
+            if vowel_count > 0:
+                svaras.append((vowel_count - 1, typ))
             i += 2
-        else:
-            clean_chars.append(itrans[i])
+            continue
+        if ch.isspace():
+            if len(clean_chars) > tok_start:
+                spans.append((tok_start, len(clean_chars), tok_vowels))
+            clean_chars.append(ch)
+            tok_start = len(clean_chars)
+            tok_vowels = 0
             i += 1
-    clean = ''.join(clean_chars)
-
-    # Enumerate vowel start-offsets in clean text
-    vowel_starts: list[int] = []
-    pos = 0
-    while pos < len(clean):
-        m = ITRANS_VOWEL_RE.match(clean, pos)
-        if m and m.start() == pos:
-            vowel_starts.append(pos)
-            pos = m.end()
+            continue
+        m = ITRANS_MARKED_VOWEL_RE.match(itrans, i)
+        if m:
+            vowel = m.group()
+            vowel_count += 1
+            tok_vowels += 1
+            if '\\' in vowel:
+                # A marker inside a digraph belongs to that vowel.
+                for mk in SVARA_MARKER_RE.finditer(vowel):
+                    svaras.append((vowel_count - 1, _MARKER_TYPE[mk.group(1)]))
+                vowel = SVARA_MARKER_RE.sub('', vowel)
+            clean_chars.append(vowel)
+            i = m.end()
         else:
-            pos += 1
-
-    # Also compute vowel end-offsets for postfix matching
-    vowel_ends: list[int] = []
-    pos = 0
-    while pos < len(clean):
-        m = ITRANS_VOWEL_RE.match(clean, pos)
-        if m and m.start() == pos:
-            vowel_ends.append(m.end())
-            pos = m.end()
+            clean_chars.append(ch)
+            i += 1
+    if len(clean_chars) > tok_start:
+        spans.append((tok_start, len(clean_chars), tok_vowels))
+
+    tokens: list[tuple[str, int, int]] = []
+    pada = 0
+    for start, end, nv in spans:
+        tok = ''.join(clean_chars[start:end])
+        if tok == '|' or tok == '||':
+            pada += 1
         else:
-            pos += 1
+            tokens.append((tok, nv, pada))
 
-    # Postfix: marker at clean_offset X modifies the last vowel whose
-    # start < X (i.e. the vowel that ended at or before X).
-    # More precisely: the vowel whose text range includes or immediately
-    # precedes the marker position.
-    svaras: list[tuple[int, str]] = []
-    for offset, typ in markers:
-        # Find the last vowel that ends at or before this offset
-        idx = bisect.bisect_right(vowel_ends, offset) - 1
-        # But the marker can also appear right after consonants following
-        # the vowel (same syllable). So we actually want the last vowel
-        # whose start < offset.
-        idx2 = bisect.bisect_right(vowel_starts, offset) - 1
-        # Use whichever gives a valid index
-        vi = max(idx, idx2)
-        if vi >= 0:
-            svaras.append((vi, typ))
+    return ''.join(clean_chars), svaras, tokens
+
+
+def strip_svaras(itrans: str):
+    """Remove \\`, \\', \\" markers. Return (clean_text, svara_list).
 
+    Markers are postfix: they follow the vowel they modify.
+    svara_list: [(vowel_index, type), ...] 0-based in clean text.
+    """
+    clean, svaras, _ = scan_verse(itrans)
     return clean, svaras
 
 
@@ -126,46 +164,32 @@ def strip_svaras(itrans: str):
 # 2. Devanagari vowel-position finder
 # ===================================================================
 
+def _char_class(chars) -> str:
+    return '[' + ''.join(sorted(chars)) + ']'
+
+
+# A vowel-bearing unit: independent vowel, consonant + matra, or a bare
+# consonant not killed by a virama.
+DEVA_VOWEL_UNIT_RE = re.compile(
+    _char_class(DEVA_INDEP_VOWELS)
+    + '|' + _char_class(DEVA_CONSONANTS)
+    + '(?:' + _char_class(DEVA_MATRAS) + '|(?!' + DEVA_VIRAMA + '))'
+)
+
+
 def deva_vowel_positions(deva: str) -> list[int]:
     """Return insertion-point indices for each logical vowel in Devanagari.
 
     Each entry is the character index where a combining svara mark
     should be inserted (right after the vowel/matra).
     """
-    positions: list[int] = []
-    i = 0
-    n = len(deva)
-    while i < n:
-        cp = ord(deva[i])
-        if cp in DEVA_INDEP_VOWELS:
-            positions.append(i + 1)
-            i += 1
-        elif cp in DEVA_CONSONANTS:
-            if i + 1 < n and deva[i + 1] == DEVA_VIRAMA:
-                i += 2
-            elif i + 1 < n and ord(deva[i + 1]) in DEVA_MATRAS:
-                positions.append(i + 2)
-                i += 2
-            else:
-                positions.append(i + 1)
-                i += 1
-        else:
-            i += 1
-    return positions
+    return [m.end() for m in DEVA_VOWEL_UNIT_RE.finditer(deva)]
 
 
 # ===================================================================
 # 3. Svara reinjection
 # ===================================================================
 
-def _svara_mark(typ: str) -> str:
-    if typ == 'anudatta':
-        return SVARA_ANUDATTA
-    if typ == 'ind_svarita':
-        return SVARA_IND_SVARITA
-    return SVARA_SVARITA
-
-
 def inject_deva(deva: str, svaras: list[tuple[int, str]]) -> str:
     if not svaras:
         return deva
@@ -173,121 +197,111 @@ def inject_deva(deva: str, svaras: list[tuple[int, str]]) -> str:
     inserts: dict[int, str] = {}
     for vidx, typ in svaras:
         if vidx < len(vpos):
-            inserts[vpos[vidx]] = _svara_mark(typ)
+            inserts[vpos[vidx]] = _SVARA_MARK[typ]
+    # Splice marks in between slices of the untouched text.
     out: list[str] = []
-    for i, ch in enumerate(deva):
-        if i in inserts:
-            out.append(inserts[i])
-        out.append(ch)
-    if len(deva) in inserts:
-        out.append(inserts[len(deva)])
+    prev = 0
+    for pos in sorted(inserts):
+        out.append(deva[prev:pos])
+        out.append(inserts[pos])
+        prev = pos
+    out.append(deva[prev:])
     return ''.join(out)
 
 
+def _make_iast_injector(svara_map: dict[int, str]):
+    """Return an IAST_VOWEL_RE.sub callback that appends each vowel's mark."""
+    vi = -1
+
+    def rep(m: re.Match) -> str:
+        nonlocal vi
+        vi += 1
+        typ = svara_map.get(vi)
+        return m.group() + _SVARA_MARK[typ] if typ else m.group()
+
+    return rep
+
+
 def inject_iast(iast: str, svaras: list[tuple[int, str]]) -> str:
     if not svaras:
         return iast
-    vowel_spans: list[tuple[int, int]] = []
-    pos = 0
-    while pos < len(iast):
-        m = IAST_VOWEL_RE.match(iast, pos)
-        if m and m.start() == pos:
-            vowel_spans.append((m.start(), m.end()))
-            pos = m.end()
-        else:
-            pos += 1
-
     svara_map: dict[int, str] = {vi: t for vi, t in svaras}
     # Udatta is unmarked in Vedic convention — no inference needed.
-
-    out: list[str] = []
-    vi = 0
-    pos = 0
-    while pos < len(iast):
-        m = IAST_VOWEL_RE.match(iast, pos)
-        if m and m.start() == pos:
-            out.append(m.group())
-            if vi in svara_map:
-                out.append(_svara_mark(svara_map[vi]))
-            vi += 1
-            pos = m.end()
-        else:
-            out.append(iast[pos])
-            pos += 1
-    return ''.join(out)
+    return IAST_VOWEL_RE.sub(_make_iast_injector(svara_map), iast)
 
 
 # ===================================================================
 # 4. Per-token transliteration
 # ===================================================================
 
+# Clean ITRANS token → (devanagari, iast). Common particles and pronouns
+# recur across every verse, so each distinct token is converted once.
+_PLAIN_CACHE: dict[str, tuple[str, str]] = {}
+
+
 def transliterate_token_plain(itrans_tok: str):
-    deva = translit(itrans_tok, sanscript.ITRANS, sanscript.DEVANAGARI)
-    iast = translit(itrans_tok, sanscript.ITRANS, sanscript.IAST)
-    return deva, iast
+    hit = _PLAIN_CACHE.get(itrans_tok)
+    if hit is None:
+        deva = translit(itrans_tok, sanscript.ITRANS, sanscript.DEVANAGARI)
+        iast = translit(itrans_tok, sanscript.ITRANS, sanscript.IAST)
+        hit = _PLAIN_CACHE[itrans_tok] = (deva, iast)
+    return hit
 
 
-# ===================================================================
-# 5. Verse-level processing
-# ===================================================================
+def transliterate_tokens_plain(itrans_toks: list[str]):
+    """Return ([devanagari, ...], [iast, ...]) for a verse's clean tokens.
 
-def _split_tokens(clean_itrans: str):
-    """Split clean ITRANS into tokens, skipping | and ||.
-    Returns [(token_str, pada_idx), ...]
+    Tokens not yet cached go through translit in one batch per script and
+    are split back on spaces; if that ever fails to line up, fall back to
+    converting them one at a time.
     """
-    parts = clean_itrans.split()
-    tokens = []
-    pada = 0
-    for p in parts:
-        if p == '|':
-            pada += 1
-        elif p == '||':
-            pada += 1
+    misses = [tok for tok in dict.fromkeys(itrans_toks) if tok not in _PLAIN_CACHE]
+    if misses:
+        joined = ' '.join(misses)
+        deva_toks = translit(joined, sanscript.ITRANS, sanscript.DEVANAGARI).split(' ')
+        iast_toks = translit(joined, sanscript.ITRANS, sanscript.IAST).split(' ')
+        if len(deva_toks) == len(misses) and len(iast_toks) == len(misses):
+            _PLAIN_CACHE.update(zip(misses, zip(deva_toks, iast_toks)))
         else:
-            tokens.append((p, pada))
-    return tokens
-
-
-def _count_vowels(itrans: str) -> int:
-    n = 0
-    pos = 0
-    while pos < len(itrans):
-        m = ITRANS_VOWEL_RE.match(itrans, pos)
-        if m and m.start() == pos:
-            n += 1
-            pos = m.end()
-        else:
-            pos += 1
-    return n
+            for tok in misses:
+                transliterate_token_plain(tok)
+    pairs = [_PLAIN_CACHE[tok] for tok in itrans_toks]
+    return [d for d, _ in pairs], [ia for _, ia in pairs]
 
 
+# ===================================================================
+# 5. Verse-level processing
+# ===================================================================
+
 def build_verse(verse_number: str, raw_itrans: str) -> dict:
     """Build verse JSON from raw ITRANS (with svara markers)."""
-    clean, svaras = strip_svaras(raw_itrans)
-    tok_list = _split_tokens(clean)
+    _, svaras, tok_list = scan_verse(raw_itrans)
+
+    deva_toks, iast_toks = transliterate_tokens_plain([tok for tok, _, _ in tok_list])
 
     token_dicts = []
+    deva_parts: list[str] = []
+    iast_parts: list[str] = []
+    lp = 0
     cum = 0
-    for idx, (tok, pada) in enumerate(tok_list):
-        nv = _count_vowels(tok)
-        tok_svaras = [(vi - cum, t) for vi, t in svaras
-                      if cum <= vi < cum + nv]
-        dp, ip = transliterate_token_plain(tok)
-        d = inject_deva(dp, tok_svaras)
-        ia = inject_iast(ip, tok_svaras)
+    sv_idx = 0   # svaras are in vowel order, so peel them off with a cursor
+    for idx, (tok, nv, pada) in enumerate(tok_list):
+        tok_svaras = []
+        while sv_idx < len(svaras) and svaras[sv_idx][0] < cum + nv:
+            vi, t = svaras[sv_idx]
+            tok_svaras.append((vi - cum, t))
+            sv_idx += 1
+        d = inject_deva(deva_toks[idx], tok_svaras)
+        ia = inject_iast(iast_toks[idx], tok_svaras)
         token_dicts.append({"idx": idx, "devanagari": d, "iast": ia})
         cum += nv
 
-    deva_parts: list[str] = []
-    iast_parts: list[str] = []
-    lp = 0
-    for idx, (tok, pada) in enumerate(tok_list):
         if pada > lp:
             deva_parts.append('।')
             iast_parts.append('|')
             lp = pada
-        deva_parts.append(token_dicts[idx]["devanagari"])
-        iast_parts.append(token_dicts[idx]["iast"])
+        deva_parts.append(d)
+        iast_parts.append(ia)
 
     return {
         "number": verse_number,
@@ -413,10 +427,14 @@ def parse_itx(filepath: Path) -> list[tuple[str, str]]:
 # 7. Legacy parsers (for backward compatibility)
 # ===================================================================
 
+RV_MARKER_RE    = re.compile(r'\|\|\s*10\\\.090\\\.(\d+)')
+RV_PREV_HYMN_RE = re.compile(r'\|\|\s*10\\\.089')
+RV_NEXT_HYMN_RE = re.compile(r'\|\|\s*10\\\.09[1-9]')
+
+
 def parse_rv(filepath: Path) -> list[tuple[str, str]]:
     text = filepath.read_text(encoding='utf-8')
     lines = text.split('\n')
-    marker_re = re.compile(r'\|\|\s*10\\\.090\\\.(\d+)')
     verses = []
     buf: list[str] = []
 
@@ -424,15 +442,15 @@ def parse_rv(filepath: Path) -> list[tuple[str, str]]:
     # by scanning for the first marker and then looking backwards.
     start_idx = None
     for i, line in enumerate(lines):
-        if marker_re.search(line):
+        if RV_MARKER_RE.search(line):
             # Look back for lines that are part of this verse
             start_idx = i
             # Check previous lines for content before marker 01
             for j in range(i - 1, max(i - 5, -1), -1):
                 s = lines[j].strip()
-                if s and not marker_re.search(lines[j]):
+                if s and not RV_MARKER_RE.search(lines[j]):
                     # Check it's not from a different hymn
-                    if re.search(r'\|\|\s*10\\\.089', lines[j]):
+                    if RV_PREV_HYMN_RE.search(lines[j]):
                         break
                     start_idx = j
                 else:
@@ -443,7 +461,7 @@ def parse_rv(filepath: Path) -> list[tuple[str, str]]:
         return verses
 
     for line in lines[start_idx:]:
-        m = marker_re.search(line)
+        m = RV_MARKER_RE.search(line)
         if m:
             vnum = int(m.group(1))
             before = line[:m.start()].strip()
@@ -456,7 +474,7 @@ def parse_rv(filepath: Path) -> list[tuple[str, str]]:
         else:
             s = line.strip()
             if s:
-                if re.search(r'\|\|\s*10\\\.09[1-9]', line):
+                if RV_NEXT_HYMN_RE.search(line):
                     break
                 buf.append(s)
     return verses
@@ -558,18 +576,21 @@ TA_PADA_MAP = [
     (41, None, None, "3.13.41"),
 ]
 
+TA_END_RE   = re.compile(r'\|\|\s*0\|\s*3\|\s*1[23]\|\s*(\d+)\s*\|\|')
+TA_START_RE = re.compile(r'^(\d+)\s+')
+TA_ANU11_RE = re.compile(r'\|\|\s*11\s*\|\|')
+TA_PAREN_RE = re.compile(r'\([^)]*\)')
+TA_BAR_RE   = re.compile(r'\|\|[^|]*\|\|')
+
 
 def parse_ta(filepath: Path) -> list[tuple[str, str]]:
     text = filepath.read_text(encoding='utf-8')
     lines = text.split('\n')
 
-    end_re = re.compile(r'\|\|\s*0\|\s*3\|\s*1[23]\|\s*(\d+)\s*\|\|')
-    start_re = re.compile(r'^(\d+)\s+')
-
     # Find the end of anuvaka 11 (|| 11||) to scope our search
     anuvaka_11_end = None
     for i, line in enumerate(lines):
-        if re.search(r'\|\|\s*11\s*\|\|', line) and i > 1200:
+        if TA_ANU11_RE.search(line) and i > 1200:
             anuvaka_11_end = i
             break
 
@@ -582,7 +603,7 @@ def parse_ta(filepath: Path) -> list[tuple[str, str]]:
     parts: list[str] = []
 
     for line in lines[anuvaka_11_end:]:
-        sm = start_re.match(line)
+        sm = TA_START_RE.match(line)
         if sm:
             vn = int(sm.group(1))
             if 33 <= vn <= 41:
@@ -597,7 +618,7 @@ def parse_ta(filepath: Path) -> list[tuple[str, str]]:
                 break
 
         if cur is not None:
-            em = end_re.search(line)
+            em = TA_END_RE.search(line)
             if em:
                 before = line[:em.start()].strip()
                 if before:
@@ -615,12 +636,12 @@ def parse_ta(filepath: Path) -> list[tuple[str, str]]:
 
     for vn in raw:
         raw[vn] = raw[vn].replace('{\\m+}', 'M')
-        raw[vn] = re.sub(r'\([^)]*\)', '', raw[vn])
+        raw[vn] = TA_PAREN_RE.sub('', raw[vn])
 
     verse_padas: dict[int, list[str]] = {}
     for vn, txt in raw.items():
-        txt = re.sub(r'\|\|[^|]*\|\|', '', txt)
-        padas = [p.strip() for p in txt.split('|') if p.strip()]
+        txt = TA_BAR_RE.sub('', txt)
+        padas = [s for p in txt.split('|') if (s := p.strip())]
         verse_padas[vn] = padas
 
     merge: dict[str, list[str]] = {}
@@ -737,6 +758,88 @@ def parse_ts(filepath: Path) -> list[tuple[str, str]]:
 # 9. Generic Conversion
 # ===================================================================
 
+def _report_verse(label: str, vj: dict) -> None:
+    if len(vj['tokens']) > 0:
+        print(f"  {label}: {len(vj['tokens'])} tokens — {vj['tokens'][0]['devanagari']}…")
+    else:
+        print(f"  {label}: {len(vj['tokens'])} tokens")
+
+
+def _build_verses(verses: list[tuple[str, str]]) -> list[dict]:
+    workers = os.cpu_count() or 1
+    if workers > 1 and len(verses) >= PARALLEL_MIN_VERSES:
+        # Verses are independent; ex.map returns them in input order.
+        labels = [label for label, _ in verses]
+        raws = [raw for _, raw in verses]
+        chunksize = max(1, len(verses) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            vjs = list(ex.map(build_verse, labels, raws, chunksize=chunksize))
+        for label, vj in zip(labels, vjs):
+            _report_verse(label, vj)
+        return vjs
+
+    vjs = []
+    for label, raw in verses:
+        vj = build_verse(label, raw)
+        vjs.append(vj)
+        _report_verse(label, vj)
+    return vjs
+
+
+def _cached_build(filepath: Path, tag: str, parse) -> list[dict]:
+    """Parse filepath and build its verse dicts, reusing a pickled result.
+
+    The cache key hashes the source file, this script and the installed
+    indic_transliteration version, so changing any of them forces a rebuild.
+    """
+    h = hashlib.sha1(filepath.read_bytes())
+    h.update(Path(__file__).read_bytes())
+    h.update(importlib.metadata.version('indic_transliteration').encode())
+    sig = h.hexdigest()
+    cache = CACHE_DIR / f"{tag}_{sig}.pkl"
+    if cache.exists():
+        try:
+            with cache.open('rb') as f:
+                vjs = pickle.load(f)
+        except Exception as e:
+            # Unreadable (e.g. truncated) cache: drop it and rebuild.
+            print(f"  Ignoring unreadable cache {cache.name}: {e}")
+            cache.unlink(missing_ok=True)
+        else:
+            print(f"  Using cached verses ({cache.name})")
+            return vjs
+
+    verses = parse(filepath)
+    print(f"  Parsed {len(verses)} verses")
+    vjs = _build_verses(verses)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Match the exact "<tag>_<sha1>.pkl" shape: a plain glob on "<tag>_*"
+    # would also catch other texts whose stem starts with "<tag>_".
+    stale_re = re.compile(re.escape(tag) + r'_[0-9a-f]{40}\.pkl')
+    for stale in CACHE_DIR.glob(f"{tag}_*.pkl"):
+        if stale_re.fullmatch(stale.name):
+            stale.unlink()
+    # Write to a temp file and rename, so an interrupted run never leaves
+    # a partial pickle under the final name.
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix=f".{tag}_", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(vjs, f)
+        os.replace(tmp, cache)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return vjs
+
+
+def _write_json(path: Path, out: dict) -> None:
+    """Stream-encode out to path rather than building the whole string first."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('w', encoding='utf-8') as f:
+        json.dump(out, f, ensure_ascii=False, indent=2)
+
+
 def convert_itx(filepath: Path, output_dir: Path = OUTPUT_DIR) -> None:
     """Convert any ITX file to JSON format.
 
@@ -749,22 +852,9 @@ def convert_itx(filepath: Path, output_dir: Path = OUTPUT_DIR) -> None:
     # Extract metadata
     file_id, title = extract_metadata(filepath)
 
-    # Parse verses — auto-detect marker paradigm
-    if _detect_paradigm(filepath) == 'dot':
-        verses = parse_rv_dot(filepath)
-    else:
-        verses = parse_itx(filepath)
-    print(f"  Parsed {len(verses)} verses")
-
-    # Build verse JSON objects
-    vjs = []
-    for label, raw in verses:
-        vj = build_verse(label, raw)
-        vjs.append(vj)
-        if len(vj['tokens']) > 0:
-            print(f"  {label}: {len(vj['tokens'])} tokens — {vj['tokens'][0]['devanagari']}…")
-        else:
-            print(f"  {label}: {len(vj['tokens'])} tokens")
+    # Parse and build verses — auto-detect marker paradigm
+    parse = parse_rv_dot if _detect_paradigm(filepath) == 'dot' else parse_itx
+    vjs = _cached_build(filepath, file_id, parse)
 
     # Create output JSON
     out = {
@@ -776,8 +866,7 @@ def convert_itx(filepath: Path, output_dir: Path = OUTPUT_DIR) -> None:
 
     # Write to file
     output_path = output_dir / f"{file_id}.json"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(out, ensure_ascii=False, indent=2), encoding='utf-8')
+    _write_json(output_path, out)
     print(f"  Wrote {output_path}\n")
 
 
@@ -786,13 +875,7 @@ def convert_itx(filepath: Path, output_dir: Path = OUTPUT_DIR) -> None:
 # ===================================================================
 
 def convert_rv():
-    verses = parse_rv(RV_FILE)
-    print(f"Parsed {len(verses)} RV verses")
-    vjs = []
-    for vnum, raw in verses:
-        vj = build_verse(vnum, raw)
-        vjs.append(vj)
-        print(f"  {vnum}: {len(vj['tokens'])} tokens — {vj['tokens'][0]['devanagari']}…")
+    vjs = _cached_build(RV_FILE, "rv10-090", parse_rv)
 
     out = {
         "id": "rv10-090",
@@ -801,19 +884,12 @@ def convert_rv():
         "verses": vjs,
     }
     p = OUTPUT_DIR / "rv10-090.json"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(out, ensure_ascii=False, indent=2), encoding='utf-8')
+    _write_json(p, out)
     print(f"Wrote {p}")
 
 
 def convert_ta():
-    sub = parse_ta(TA_FILE)
-    print(f"Parsed {len(sub)} TA sub-verses")
-    vjs = []
-    for label, raw in sub:
-        vj = build_verse(label, raw)
-        vjs.append(vj)
-        print(f"  {label}: {len(vj['tokens'])} tokens — {vj['tokens'][0]['devanagari']}…")
+    vjs = _cached_build(TA_FILE, "ta3-012", parse_ta)
 
     out = {
         "id": "ta3-012",
@@ -822,19 +898,12 @@ def convert_ta():
         "verses": vjs,
     }
     p = OUTPUT_DIR / "ta3-012.json"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(out, ensure_ascii=False, indent=2), encoding='utf-8')
+    _write_json(p, out)
     print(f"Wrote {p}")
 
 
 def convert_ts():
-    verses = parse_ts(TS_FILE)
-    print(f"Parsed {len(verses)} TS verses")
-    vjs = []
-    for label, raw in verses:
-        vj = build_verse(label, raw)
-        vjs.append(vj)
-        print(f"  {label}: {len(vj['tokens'])} tokens — {vj['tokens'][0]['devanagari']}…")
+    vjs = _cached_build(TS_FILE, "ts1-001", parse_ts)
 
     out = {
         "id": "ts1-001",
@@ -843,8 +912,7 @@ def convert_ts():
         "verses": vjs,
     }
     p = OUTPUT_DIR / "ts1-001.json"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(out, ensure_ascii=False, indent=2), encoding='utf-8')
+    _write_json(p, out)
     print(f"Wrote {p}")
 
 
@@ -865,11 +933,11 @@ def run_tests():
     assert sv == [(0, 'anudatta'), (2, 'svarita'), (4, 'anudatta')], f"sv={sv}"
 
     # Test 2: Devanagari output: स॒हस्र॑शीर्षा॒
-    d, ia = build_verse("test", "sa\\`hasra\\'shIrShA\\`")['tokens'][0]['devanagari'], \
-            build_verse("test", "sa\\`hasra\\'shIrShA\\`")['tokens'][0]['iast']
+    tok2 = build_verse("test", "sa\\`hasra\\'shIrShA\\`")['tokens'][0]
+    d, ia = tok2['devanagari'], tok2['iast']
     print(f"  T2 deva={d!r}  iast={ia!r}")
-    assert DEVA_ANUDATTA in d, f"Missing anudatta in {d!r}"
-    assert DEVA_SVARITA in d, f"Missing svarita in {d!r}"
+    assert SVARA_ANUDATTA in d, f"Missing anudatta in {d!r}"
+    assert SVARA_SVARITA in d, f"Missing svarita in {d!r}"
 
     # Test 3: puru\'ShaH → svarita on 'u' (vowel 1), i.e. पुरु॑षः
     clean3, sv3 = strip_svaras("puru\\'ShaH")
@@ -897,9 +965,9 @@ def run_tests():
     # Test 5: independent svarita \"
     clean5, sv5 = strip_svaras('pAdo\\".asya\\`')
     print(f"  T5 clean={clean5!r}  sv={sv5}")
-    # pAdo.asya: vowels A(0), o(1), a(2), a(3)  — wait, '.' is .a?
-    # Actually in ITRANS '.a' is avagraha. 'pAdo.asya' → pAdo + avagraha + sya
-    # Let me just check the offsets.
+    # \" follows the 'o' of pAdo → independent svarita on vowel 1
+    assert clean5 == "pAdo.asya", f"clean5={clean5!r}"
+    assert sv5[0] == (1, 'ind_svarita'), f"sv5={sv5}"
 
     print("\nAll tests passed!")
     return True